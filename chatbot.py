@@ -5,32 +5,38 @@ from __future__ import annotations
 
 import asyncio
 import datetime as dt
-import json
 import os
+import time
 import uuid
 from contextlib import AsyncExitStack
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 
+import orjson
 import yaml
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 from dotenv import load_dotenv
 from mcp import ClientSession, StdioServerParameters, types as mcp_types
 from mcp.client.stdio import stdio_client
+from prompt_toolkit import PromptSession
+from prompt_toolkit.completion import WordCompleter
 
 load_dotenv()
 
 CONFIG_PATH = os.environ.get("MCP_SERVER_CONFIG", "server_config.yaml")
+MODEL = "claude-3-7-sonnet-20250219"
+MAX_TOKENS = 2024
 
 
 class MCPChatBot:
     def __init__(self) -> None:
         self.exit_stack = AsyncExitStack()
-        self.anthropic = Anthropic()
+        self.anthropic = AsyncAnthropic()
         self.sessions: Dict[str, ClientSession] = {}
         self.available_tools: List[Dict[str, Any]] = []
         self.tool_to_session: Dict[str, ClientSession] = {}
         self.log_dir = Path(os.environ.get("CHATBOT_LOG_DIR", "documents/chat_logs"))
+        self._ts_cache: Tuple[int, str] = (0, "")
 
     async def connect(self, config_path: str = CONFIG_PATH) -> None:
         config = self._load_config(config_path)
@@ -43,6 +49,8 @@ class MCPChatBot:
 
         if not self.available_tools:
             raise RuntimeError("No tools available after connecting to servers.")
+        # Tool definitions are resent unchanged on every turn; mark the end of the block cacheable.
+        self.available_tools[-1]["cache_control"] = {"type": "ephemeral"}
 
     def _load_config(self, path: str) -> Dict[str, Any]:
         try:
@@ -115,7 +123,7 @@ class MCPChatBot:
             text = getattr(item, "text", None)
             if text is None:
                 try:
-                    text = json.dumps(item.model_dump(), indent=2)
+                    text = orjson.dumps(item.model_dump(), option=orjson.OPT_INDENT_2).decode("utf-8")
                 except Exception:
                     text = str(item)
             blocks.append({"type": "text", "text": text})
@@ -123,28 +131,91 @@ class MCPChatBot:
             blocks.append({"type": "text", "text": ""})
         return blocks
 
+    def _timestamp(self) -> str:
+        """Return the current UTC time at second resolution, reusing the string within the same second."""
+        now = int(time.time())
+        cached_at, cached = self._ts_cache
+        if now != cached_at:
+            cached = dt.datetime.fromtimestamp(now, dt.UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+            self._ts_cache = (now, cached)
+        return cached
+
     def _init_trace(self, query: str) -> Dict[str, Any]:
-        trace_id = f"{dt.datetime.now(dt.UTC).strftime('%Y%m%dT%H%M%S')}_{uuid.uuid4().hex[:6]}"
-        return {
+        now = dt.datetime.now(dt.UTC)
+        trace_id = f"{now.strftime('%Y%m%dT%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        header = {
             "trace_id": trace_id,
-            "started_at": dt.datetime.now(dt.UTC).isoformat(timespec="seconds").replace("+00:00", "Z"),
+            "started_at": now.isoformat(timespec="seconds").replace("+00:00", "Z"),
             "query": query,
-            "events": [],
         }
+        file_path = self.log_dir / f"{trace_id}.jsonl"
+        handle: Optional[BinaryIO] = None
+        try:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            handle = file_path.open("wb")
+            handle.write(orjson.dumps(header, option=orjson.OPT_APPEND_NEWLINE))
+            handle.flush()
+        except Exception as exc:
+            print(f"\n[trace] Failed to open conversation trace: {exc}")
+            if handle is not None:
+                handle.close()
+                handle = None
+        return {**header, "path": file_path, "handle": handle}
 
     def _append_event(self, trace: Dict[str, Any], event: Dict[str, Any]) -> None:
-        event["timestamp"] = dt.datetime.now(dt.UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
-        trace["events"].append(event)
+        event["timestamp"] = self._timestamp()
+        handle = trace["handle"]
+        if handle is None:
+            return
+        try:
+            handle.write(orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE))
+            # Flush per event so a crash mid-query keeps everything logged up to that point.
+            handle.flush()
+        except Exception as exc:
+            print(f"\n[trace] Failed to append trace event: {exc}")
+            handle.close()
+            trace["handle"] = None
 
     def _write_trace(self, trace: Dict[str, Any]) -> None:
+        handle = trace["handle"]
+        if handle is None:
+            return
         try:
-            self.log_dir.mkdir(parents=True, exist_ok=True)
-            file_path = self.log_dir / f"{trace['trace_id']}.json"
-            with file_path.open("w", encoding="utf-8") as handle:
-                json.dump(trace, handle, indent=2, ensure_ascii=False)
-            print(f"\n[trace] Conversation saved to {file_path}")
+            handle.close()
+            print(f"\n[trace] Conversation saved to {trace['path']}")
         except Exception as exc:
             print(f"\n[trace] Failed to save conversation trace: {exc}")
+        finally:
+            trace["handle"] = None
+
+    async def _safe_call(self, tool_block: Any) -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
+        """Invoke a tool_use block and return its result blocks plus the matching trace event."""
+        try:
+            result = await self.call_tool(tool_block.name, tool_block.input or {})
+        except Exception as exc:
+            error_text = f"Error calling tool '{tool_block.name}': {exc}"
+            print(error_text)
+            return [{"type": "text", "text": error_text}], {
+                "type": "tool_error",
+                "tool_name": tool_block.name,
+                "tool_use_id": tool_block.id,
+                "error": str(exc),
+            }
+        result_blocks = self._result_content_blocks(result)
+        return result_blocks, {
+            "type": "tool_result",
+            "tool_name": tool_block.name,
+            "tool_use_id": tool_block.id,
+            "content": result_blocks,
+        }
+
+    async def _create_message(self, messages: List[Dict[str, Any]]) -> Any:
+        return await self.anthropic.messages.create(
+            model=MODEL,
+            max_tokens=MAX_TOKENS,
+            tools=self.available_tools,
+            messages=messages,
+        )
 
     async def process_query(self, query: str) -> None:
         messages: List[Dict[str, Any]] = [
@@ -154,12 +225,7 @@ class MCPChatBot:
         self._append_event(trace, {"type": "user", "text": query})
 
         try:
-            response = self.anthropic.messages.create(
-                model="claude-3-7-sonnet-20250219",
-                max_tokens=2024,
-                tools=self.available_tools,
-                messages=messages,
-            )
+            response = await self._create_message(messages)
 
             while True:
                 assistant_payload: List[Dict[str, Any]] = []
@@ -191,33 +257,9 @@ class MCPChatBot:
                 if not tool_requests:
                     break
 
-                for tool_block in tool_requests:
-                    try:
-                        result = await self.call_tool(tool_block.name, tool_block.input or {})
-                        result_blocks = self._result_content_blocks(result)
-                        self._append_event(
-                            trace,
-                            {
-                                "type": "tool_result",
-                                "tool_name": tool_block.name,
-                                "tool_use_id": tool_block.id,
-                                "content": result_blocks,
-                            },
-                        )
-                    except Exception as exc:
-                        error_text = f"Error calling tool '{tool_block.name}': {exc}"
-                        print(error_text)
-                        result_blocks = [{"type": "text", "text": error_text}]
-                        self._append_event(
-                            trace,
-                            {
-                                "type": "tool_error",
-                                "tool_name": tool_block.name,
-                                "tool_use_id": tool_block.id,
-                                "error": str(exc),
-                            },
-                        )
-
+                outcomes = await asyncio.gather(*(self._safe_call(block) for block in tool_requests))
+                for tool_block, (result_blocks, event) in zip(tool_requests, outcomes):
+                    self._append_event(trace, event)
                     messages.append(
                         {
                             "role": "user",
@@ -231,22 +273,19 @@ class MCPChatBot:
                         }
                     )
 
-                response = self.anthropic.messages.create(
-                    model="claude-3-7-sonnet-20250219",
-                    max_tokens=2024,
-                    tools=self.available_tools,
-                    messages=messages,
-                )
+                response = await self._create_message(messages)
         finally:
             self._write_trace(trace)
 
     async def chat_loop(self) -> None:
         print("\nMCP Chatbot Started!")
         print("Type queries or 'quit' to exit.")
+        prompt = PromptSession(completer=WordCompleter([tool["name"] for tool in self.available_tools]))
 
         while True:
             try:
-                query = (await asyncio.to_thread(input, "\nQuery: ")).strip()
+                print()
+                query = (await prompt.prompt_async("Query: ")).strip()
             except (EOFError, KeyboardInterrupt):
                 print("\nExiting chat.")
                 break
@@ -263,7 +302,10 @@ class MCPChatBot:
                 print(f"\nError: {exc}")
 
     async def cleanup(self) -> None:
-        await self.exit_stack.aclose()
+        try:
+            await self.exit_stack.aclose()
+        finally:
+            await self.anthropic.close()
 
 
 async def main() -> None:
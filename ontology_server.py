@@ -2,6 +2,7 @@
 """
 MCP Server: Ontology Knowledge Search (stdio)
 - search_literature: query literature indices (Europe PMC, PubMed, Semantic Scholar, etc.) and persist hits
+- search_literature_multi: query several literature indices concurrently and persist hits per source
 - search_pathology_reference: pull high-yield pathology reference snippets to cache locally
 - search_terminology: query ontology services for definitions, synonyms, and relationships
 - fetch_results: retrieve stored hits for a keyword (optionally filtered by source)
@@ -9,14 +10,17 @@ MCP Server: Ontology Knowledge Search (stdio)
 
 from __future__ import annotations
 
-import json
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import orjson
 
 try:
     from fastmcp import FastMCP
 except ImportError as exc:
     raise SystemExit("fastmcp is not installed. Run: pip install fastmcp") from exc
 
+from ontology_services.db import data_version
 from ontology_services.extraction import run_extraction
 from ontology_services.ontology_builder import build_and_save_tree
 from ontology_services.providers import (
@@ -27,7 +31,7 @@ from ontology_services.providers import (
     OntologySource,
     PathologySource,
 )
-from ontology_services.search import execute_search
+from ontology_services.search import _dumps, execute_search, execute_search_multi
 from ontology_services.storage import read_results, read_search
 
 mcp = FastMCP("ontology_knowledge")
@@ -43,6 +47,16 @@ def search_literature(
     return execute_search(keyword, source, "search_literature", max_results, LITERATURE_PROVIDERS)
 
 
+@mcp.tool()
+def search_literature_multi(
+    keyword: str,
+    sources: List[LiteratureSource],
+    max_results: int = 5,
+) -> str:
+    """Query several literature sources concurrently and persist each source's results."""
+    return execute_search_multi(keyword, sources, "search_literature_multi", max_results, LITERATURE_PROVIDERS)
+
+
 @mcp.tool()
 def search_pathology_reference(
     keyword: str,
@@ -63,42 +77,38 @@ def search_terminology(
     return execute_search(keyword, source, "search_terminology", max_results, ONTOLOGY_PROVIDERS)
 
 
-@mcp.tool()
-def fetch_results(keyword: str, source: Optional[str] = None) -> str:
-    """Retrieve cached search results for a keyword."""
-    keyword = keyword.strip()
-    if not keyword:
-        return json.dumps({"status": "error", "error": "Keyword must not be empty."}, indent=2)
-
+# Read responses are memoized on db.data_version(), which changes after any write to the database (from this or
+# another server process), so hits skip SQL and JSON work.
+@lru_cache(maxsize=256)
+def _fetch_results_response(keyword: str, source: Optional[str], version: Tuple[int, int]) -> str:
     payload = read_results(keyword, source)
     if not payload["sources"]:
-        return json.dumps(
-            {"status": "not_found", "keyword": keyword, "source": source, "message": "No cached results."},
-            indent=2,
+        return _dumps(
+            {"status": "not_found", "keyword": keyword, "source": source, "message": "No cached results."}
         )
     payload["available_sources"] = sorted(payload["sources"])
-    return json.dumps({"status": "ok", "data": payload}, indent=2, ensure_ascii=False)
+    return _dumps({"status": "ok", "data": payload})
 
 
-@mcp.tool()
-def query_cache(
-    search_id: Optional[int] = None,
-    keyword: Optional[str] = None,
-    source: Optional[str] = None,
-    include_results: bool = True,
-    include_extractions: bool = True,
+@lru_cache(maxsize=256)
+def _query_cache_response(
+    search_id: Optional[int],
+    keyword: Optional[str],
+    source: Optional[str],
+    include_results: bool,
+    include_extractions: bool,
+    version: Tuple[int, int],
 ) -> str:
-    """Query cached searches or extractions using flexible filters."""
     if search_id is not None:
         bundle = read_search(search_id, include_results=include_results, include_extractions=include_extractions)
         if not bundle:
-            return json.dumps({"status": "not_found", "search_id": search_id}, indent=2)
-        return json.dumps({"status": "ok", "data": bundle}, indent=2, ensure_ascii=False)
+            return _dumps({"status": "not_found", "search_id": search_id})
+        return _dumps({"status": "ok", "data": bundle})
 
     if keyword:
         payload = read_results(keyword.strip(), source)
         if not payload["sources"]:
-            return json.dumps({"status": "not_found", "keyword": keyword, "source": source}, indent=2)
+            return _dumps({"status": "not_found", "keyword": keyword, "source": source})
         for src, entry in payload["sources"].items():
             for search in entry.get("searches", []):
                 if not include_results:
@@ -106,9 +116,30 @@ def query_cache(
                 if not include_extractions:
                     search.pop("extractions", None)
         payload["available_sources"] = sorted(payload["sources"])
-        return json.dumps({"status": "ok", "data": payload}, indent=2, ensure_ascii=False)
+        return _dumps({"status": "ok", "data": payload})
+
+    return _dumps({"status": "error", "error": "Provide either search_id or keyword."})
+
+
+@mcp.tool()
+def fetch_results(keyword: str, source: Optional[str] = None) -> str:
+    """Retrieve cached search results for a keyword."""
+    keyword = keyword.strip()
+    if not keyword:
+        return _dumps({"status": "error", "error": "Keyword must not be empty."})
+    return _fetch_results_response(keyword, source, data_version())
+
 
-    return json.dumps({"status": "error", "error": "Provide either search_id or keyword."}, indent=2)
+@mcp.tool()
+def query_cache(
+    search_id: Optional[int] = None,
+    keyword: Optional[str] = None,
+    source: Optional[str] = None,
+    include_results: bool = True,
+    include_extractions: bool = True,
+) -> str:
+    """Query cached searches or extractions using flexible filters."""
+    return _query_cache_response(search_id, keyword, source, include_results, include_extractions, data_version())
 
 
 @mcp.tool()
@@ -125,13 +156,13 @@ def ontology_extract(
     """
     keyword = keyword.strip()
     if not keyword:
-        return json.dumps({"status": "error", "error": "Keyword must not be empty."}, indent=2)
+        return _dumps({"status": "error", "error": "Keyword must not be empty."})
     extraction_payload = None
     if extraction:
         try:
-            extraction_payload = json.loads(extraction)
-        except json.JSONDecodeError as exc:
-            return json.dumps({"status": "error", "error": f"Invalid extraction JSON: {exc}"}, indent=2)
+            extraction_payload = orjson.loads(extraction)
+        except orjson.JSONDecodeError as exc:
+            return _dumps({"status": "error", "error": f"Invalid extraction JSON: {exc}"})
     try:
         result = run_extraction(
             keyword=keyword,
@@ -142,8 +173,8 @@ def ontology_extract(
             extraction_payload=extraction_payload,
         )
     except Exception as exc:
-        return json.dumps({"status": "error", "error": str(exc)}, indent=2)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+        return _dumps({"status": "error", "error": str(exc)})
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -152,8 +183,8 @@ def build_ontology_tree(include_base: bool = True, version_name: Optional[str] =
     try:
         result = build_and_save_tree(include_base=include_base, version_name=version_name)
     except Exception as exc:
-        return json.dumps({"status": "error", "error": str(exc)}, indent=2)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+        return _dumps({"status": "error", "error": str(exc)})
+    return _dumps(result)
 
 
 if __name__ == "__main__":
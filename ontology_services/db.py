@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-import json
+import atexit
 import os
+import queue
 import sqlite3
+import threading
+import time
+from collections.abc import Sized
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import orjson
 
 from .settings import STORE_ROOT
 
@@ -16,37 +22,177 @@ DB_PATH = Path(
 )
 DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
+# Per-connection settings; journal_mode=WAL is persistent but re-asserting it is cheap.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=30000",
+)
+
+READER_POOL_SIZE = 4
+OPTIMIZE_INTERVAL_SECONDS = 15 * 60
+
+_writer: Optional[sqlite3.Connection] = None
+_writer_lock = threading.Lock()
+_readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+_reader_slots = threading.BoundedSemaphore(READER_POOL_SIZE)
+_open_readers: List[sqlite3.Connection] = []
+_open_readers_lock = threading.Lock()
+_version_reader: Optional[sqlite3.Connection] = None
+_version_reader_lock = threading.Lock()
+_data_version = 0
+_extractions_version = 0
+_last_optimize = time.monotonic()
+
+
+# SELECTs alias JSON text columns as '<col> [JSON]' so the driver decodes them while fetching.
+sqlite3.register_converter("JSON", orjson.loads)
+
+
+def _dumps(value: Any) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
 
 def _ensure_path(path: Path) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
     return path
 
 
-def get_connection() -> sqlite3.Connection:
-    connection = sqlite3.connect(_ensure_path(DB_PATH))
+def _open_connection(query_only: bool = False) -> sqlite3.Connection:
+    connection = sqlite3.connect(
+        _ensure_path(DB_PATH),
+        check_same_thread=False,
+        isolation_level=None,
+        detect_types=sqlite3.PARSE_COLNAMES,
+    )
     connection.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        connection.execute(pragma)
+    if query_only:
+        connection.execute("PRAGMA query_only=ON")
+    return connection
+
+
+def get_connection() -> sqlite3.Connection:
+    """Open a standalone autocommit connection with the standard pragmas; the caller closes it."""
+    return _open_connection()
+
+
+def _get_writer() -> sqlite3.Connection:
+    # Callers hold _writer_lock.
+    global _writer
+    if _writer is None:
+        _writer = _open_connection()
+    return _writer
+
+
+def _maybe_optimize(connection: sqlite3.Connection) -> None:
+    # Called on the writer after a commit; refreshes planner statistics at most every interval.
+    global _last_optimize
+    now = time.monotonic()
+    if now - _last_optimize < OPTIMIZE_INTERVAL_SECONDS:
+        return
+    _last_optimize = now
+    try:
+        connection.execute("PRAGMA optimize")
+    except sqlite3.Error:
+        pass
+
+
+def _acquire_reader() -> sqlite3.Connection:
+    _reader_slots.acquire()
+    try:
+        return _readers.get_nowait()
+    except queue.Empty:
+        pass
+    try:
+        connection = _open_connection(query_only=True)
+    except BaseException:
+        _reader_slots.release()
+        raise
+    with _open_readers_lock:
+        _open_readers.append(connection)
     return connection
 
 
+def _release_reader(connection: sqlite3.Connection) -> None:
+    _readers.put(connection)
+    _reader_slots.release()
+
+
+def close_connections() -> None:
+    global _writer, _version_reader
+    with _writer_lock:
+        connections = [_writer] if _writer is not None else []
+        if _writer is not None:
+            try:
+                _writer.execute("PRAGMA optimize")
+                _writer.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error:
+                pass
+        _writer = None
+    with _version_reader_lock:
+        if _version_reader is not None:
+            connections.append(_version_reader)
+        _version_reader = None
+    with _open_readers_lock:
+        connections.extend(_open_readers)
+        _open_readers.clear()
+    while True:
+        try:
+            _readers.get_nowait()
+        except queue.Empty:
+            break
+    for connection in connections:
+        try:
+            connection.close()
+        except sqlite3.Error:
+            pass
+
+
+atexit.register(close_connections)
+
+
 @contextmanager
 def db_cursor(commit: bool = False) -> Iterator[sqlite3.Cursor]:
-    conn = get_connection()
-    try:
+    """Yield a cursor on the shared writer (``commit=True``) or a pooled query-only reader."""
+    if not commit:
+        conn = _acquire_reader()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+            _release_reader(conn)
+        return
+
+    with _writer_lock:
+        conn = _get_writer()
         cursor = conn.cursor()
-        yield cursor
-        if commit:
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+            except BaseException:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
             conn.commit()
-    finally:
-        conn.close()
+            _maybe_optimize(conn)
+        finally:
+            cursor.close()
 
 
 def initialize_schema() -> None:
-    with db_cursor(commit=True) as cur:
+    # executescript commits any open transaction itself, so the DDL runs in autocommit mode.
+    with _writer_lock:
+        cur = _get_writer().cursor()
         cur.executescript(
             """
-            PRAGMA journal_mode=WAL;
-            PRAGMA foreign_keys=ON;
-
             CREATE TABLE IF NOT EXISTS searches (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 keyword TEXT NOT NULL,
@@ -80,62 +226,120 @@ def initialize_schema() -> None:
                 FOREIGN KEY (search_id) REFERENCES searches(id) ON DELETE CASCADE
             );
 
-            CREATE INDEX IF NOT EXISTS idx_searches_keyword_source ON searches(keyword, source);
+            -- Ordered indexes serve keyword (optionally + source) search lookups and per-search/per-keyword
+            -- extraction lookups newest-first without a sort. Unfiltered list_extractions() and the
+            -- search_id IN (...) batch reads still sort.
+            DROP INDEX IF EXISTS idx_searches_keyword_source;
+            DROP INDEX IF EXISTS idx_extractions_search_id;
+            CREATE INDEX IF NOT EXISTS idx_searches_keyword_source_ts
+                ON searches(keyword, source, requested_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_searches_keyword_ts
+                ON searches(keyword, requested_at DESC);
             CREATE INDEX IF NOT EXISTS idx_results_search_id ON results(search_id);
-            CREATE INDEX IF NOT EXISTS idx_extractions_search_id ON extractions(search_id);
+            CREATE INDEX IF NOT EXISTS idx_extractions_search_created
+                ON extractions(search_id, created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_extractions_keyword_created
+                ON extractions(keyword, created_at DESC);
             """
         )
         cur.execute("PRAGMA table_info(searches)")
         columns = {row["name"] for row in cur.fetchall()}
         if "tool_name" not in columns:
             cur.execute("ALTER TABLE searches ADD COLUMN tool_name TEXT NOT NULL DEFAULT 'unknown'")
+        cur.close()
+
+
+_INSERT_SEARCH_SQL = """
+    INSERT INTO searches (keyword, source, tool_name, max_results, args_json)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_INSERT_RESULT_SQL = """
+    INSERT OR IGNORE INTO results
+        (search_id, title, url, published, license, snippet, payload_json)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _result_records(search_id: int, items: Iterable[Dict[str, Any]]) -> Iterator[Tuple[Any, ...]]:
+    for item in items:
+        yield (
+            search_id,
+            item.get("title") or "",
+            item.get("url") or "",
+            item.get("published") or "",
+            item.get("license") or "",
+            item.get("snippet") or "",
+            _dumps(item),
+        )
+
+
+def _database_version() -> int:
+    # PRAGMA data_version changes whenever another connection commits, including other server processes
+    # sharing the file. It is per-connection, so it is read on one dedicated connection that never writes.
+    global _version_reader
+    with _version_reader_lock:
+        if _version_reader is None:
+            _version_reader = _open_connection(query_only=True)
+        return int(_version_reader.execute("PRAGMA data_version").fetchone()[0])
+
+
+def data_version() -> Tuple[int, int]:
+    """Cache key that changes after any write to the database, from this process or another."""
+    return _data_version, _database_version()
+
+
+def _bump_data_version(extractions: bool = False) -> None:
+    global _data_version, _extractions_version
+    with _writer_lock:
+        _data_version += 1
+        if extractions:
+            _extractions_version += 1
 
 
 def insert_search(keyword: str, source: str, tool_name: str, max_results: int, args: Dict[str, Any]) -> int:
-    payload = json.dumps(args, ensure_ascii=False)
+    payload = _dumps(args)
     with db_cursor(commit=True) as cur:
-        cur.execute(
-            """
-            INSERT INTO searches (keyword, source, tool_name, max_results, args_json)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (keyword, source, tool_name, max_results, payload),
-        )
-        return int(cur.lastrowid)
+        cur.execute(_INSERT_SEARCH_SQL, (keyword, source, tool_name, max_results, payload))
+        search_id = int(cur.lastrowid)
+    _bump_data_version()
+    return search_id
 
 
 def bulk_insert_results(search_id: int, items: Iterable[Dict[str, Any]]) -> int:
-    records = []
-    for item in items:
-        payload_json = json.dumps(item, ensure_ascii=False)
-        records.append(
-            (
-                search_id,
-                item.get("title") or "",
-                item.get("url") or "",
-                item.get("published") or "",
-                item.get("license") or "",
-                item.get("snippet") or "",
-                payload_json,
-            )
-        )
-    if not records:
+    if isinstance(items, Sized) and not items:
         return 0
     with db_cursor(commit=True) as cur:
-        cur.executemany(
-            """
-            INSERT OR IGNORE INTO results
-                (search_id, title, url, published, license, snippet, payload_json)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            records,
-        )
-        return cur.rowcount
+        cur.executemany(_INSERT_RESULT_SQL, _result_records(search_id, items))
+        inserted = max(cur.rowcount, 0)
+    _bump_data_version()
+    return inserted
+
+
+def persist_search_with_results(
+    keyword: str,
+    source: str,
+    tool_name: str,
+    max_results: int,
+    args: Dict[str, Any],
+    items: Iterable[Dict[str, Any]],
+) -> Tuple[int, int]:
+    """Insert a search row and its results in one transaction; returns ``(search_id, inserted)``."""
+    payload = _dumps(args)
+    with db_cursor(commit=True) as cur:
+        cur.execute(_INSERT_SEARCH_SQL, (keyword, source, tool_name, max_results, payload))
+        search_id = int(cur.lastrowid)
+        inserted = 0
+        if not (isinstance(items, Sized) and not items):
+            cur.executemany(_INSERT_RESULT_SQL, _result_records(search_id, items))
+            inserted = max(cur.rowcount, 0)
+    _bump_data_version()
+    return search_id, inserted
 
 
 def list_searches(keyword: str, source: Optional[str] = None) -> Tuple[Dict[str, Any], ...]:
     query = """
-        SELECT id, keyword, source, tool_name, max_results, args_json, requested_at
+        SELECT id, keyword, source, tool_name, max_results, args_json AS "args_json [JSON]", requested_at
         FROM searches
         WHERE keyword = ?
     """
@@ -158,7 +362,7 @@ def list_searches(keyword: str, source: Optional[str] = None) -> Tuple[Dict[str,
                 "source": row["source"],
                 "tool_name": row["tool_name"],
                 "max_results": row["max_results"],
-                "args": json.loads(row["args_json"]),
+                "args": row["args_json"],
                 "requested_at": row["requested_at"],
             }
         )
@@ -169,7 +373,7 @@ def get_search(search_id: int) -> Optional[Dict[str, Any]]:
     with db_cursor() as cur:
         cur.execute(
             """
-            SELECT id, keyword, source, tool_name, max_results, args_json, requested_at
+            SELECT id, keyword, source, tool_name, max_results, args_json AS "args_json [JSON]", requested_at
             FROM searches
             WHERE id = ?
             """,
@@ -184,41 +388,102 @@ def get_search(search_id: int) -> Optional[Dict[str, Any]]:
         "source": row["source"],
         "tool_name": row["tool_name"],
         "max_results": row["max_results"],
-        "args": json.loads(row["args_json"]),
+        "args": row["args_json"],
         "requested_at": row["requested_at"],
     }
 
 
-def list_results(search_id: int) -> Tuple[Dict[str, Any], ...]:
+def find_recent_search(keyword: str, source: str, max_results: int, max_age_seconds: int) -> Optional[int]:
     with db_cursor() as cur:
         cur.execute(
             """
-            SELECT title, url, published, license, snippet, payload_json
-            FROM results
-            WHERE search_id = ?
-            ORDER BY id ASC
+            SELECT id
+            FROM searches
+            WHERE keyword = ? AND source = ? AND max_results = ?
+              AND requested_at >= datetime('now', ?)
+            ORDER BY requested_at DESC, id DESC
+            LIMIT 1
             """,
-            (search_id,),
+            (keyword, source, max_results, f"-{int(max_age_seconds)} seconds"),
         )
+        row = cur.fetchone()
+    return int(row["id"]) if row else None
+
+
+def _result_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    payload = row["payload_json"]
+    payload.update(
+        {
+            "title": row["title"],
+            "url": row["url"],
+            "published": row["published"],
+            "license": row["license"],
+            "snippet": row["snippet"],
+        }
+    )
+    return payload
+
+
+def iter_results(search_id: int, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Yield stored results for a search in insertion order, at most ``limit`` of them.
+
+    This is eager, not streaming: every selected row is fetched and its ``payload_json`` decoded before the first
+    item is yielded. In exchange the pooled reader is released at once, so an abandoned iterator holds no
+    connection. Pass ``limit`` to bound the work.
+    """
+    query = """
+        SELECT title, url, published, license, snippet, payload_json AS "payload_json [JSON]"
+        FROM results
+        WHERE search_id = ?
+        ORDER BY id ASC
+    """
+    params: Tuple[Any, ...] = (search_id,)
+    if limit is not None:
+        query += " LIMIT ?"
+        params = (search_id, limit)
+    with db_cursor() as cur:
+        cur.execute(query, params)
         rows = cur.fetchall()
-    results = []
     for row in rows:
-        payload = json.loads(row["payload_json"])
-        payload.update(
-            {
-                "title": row["title"],
-                "url": row["url"],
-                "published": row["published"],
-                "license": row["license"],
-                "snippet": row["snippet"],
-            }
-        )
-        results.append(payload)
-    return tuple(results)
+        yield _result_from_row(row)
+
+
+def list_results(search_id: int, limit: Optional[int] = None) -> Tuple[Dict[str, Any], ...]:
+    return tuple(iter_results(search_id, limit))
+
+
+def results_by_search(search_ids: Sequence[int]) -> Dict[int, List[Dict[str, Any]]]:
+    """Fetch the results of several searches in one query, grouped by search id in insertion order."""
+    grouped: Dict[int, List[Dict[str, Any]]] = {search_id: [] for search_id in search_ids}
+    if not grouped:
+        return grouped
+    placeholders = ", ".join("?" * len(grouped))
+    query = f"""
+        SELECT search_id, title, url, published, license, snippet, payload_json AS "payload_json [JSON]"
+        FROM results
+        WHERE search_id IN ({placeholders})
+        ORDER BY id ASC
+    """
+    with db_cursor() as cur:
+        cur.execute(query, tuple(grouped))
+        for row in cur:
+            grouped[row["search_id"]].append(_result_from_row(row))
+    return grouped
+
+
+def count_results(search_id: int) -> int:
+    with db_cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM results WHERE search_id = ?", (search_id,))
+        return int(cur.fetchone()[0])
+
+
+def extractions_version() -> Tuple[int, int]:
+    """Cache key for extractions: the local extraction counter plus the cross-process database version."""
+    return _extractions_version, _database_version()
 
 
 def insert_extraction(search_id: int, extractor: str, keyword: str, content: Dict[str, Any]) -> int:
-    content_json = json.dumps(content, ensure_ascii=False)
+    content_json = _dumps(content)
     with db_cursor(commit=True) as cur:
         cur.execute(
             """
@@ -227,12 +492,25 @@ def insert_extraction(search_id: int, extractor: str, keyword: str, content: Dic
             """,
             (search_id, extractor, keyword, content_json),
         )
-        return int(cur.lastrowid)
+        extraction_id = int(cur.lastrowid)
+    _bump_data_version(extractions=True)
+    return extraction_id
+
+
+def _extraction_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "search_id": row["search_id"],
+        "extractor": row["extractor"],
+        "keyword": row["keyword"],
+        "content": row["content_json"],
+        "created_at": row["created_at"],
+    }
 
 
 def list_extractions(search_id: Optional[int] = None, keyword: Optional[str] = None) -> Tuple[Dict[str, Any], ...]:
     query = """
-        SELECT id, search_id, extractor, keyword, content_json, created_at
+        SELECT id, search_id, extractor, keyword, content_json AS "content_json [JSON]", created_at
         FROM extractions
         WHERE 1=1
     """
@@ -247,19 +525,26 @@ def list_extractions(search_id: Optional[int] = None, keyword: Optional[str] = N
     with db_cursor() as cur:
         cur.execute(query, tuple(params))
         rows = cur.fetchall()
-    extractions = []
-    for row in rows:
-        extractions.append(
-            {
-                "id": row["id"],
-                "search_id": row["search_id"],
-                "extractor": row["extractor"],
-                "keyword": row["keyword"],
-                "content": json.loads(row["content_json"]),
-                "created_at": row["created_at"],
-            }
-        )
-    return tuple(extractions)
+    return tuple(_extraction_from_row(row) for row in rows)
+
+
+def extractions_by_search(search_ids: Sequence[int]) -> Dict[int, List[Dict[str, Any]]]:
+    """Fetch the extractions of several searches in one query, grouped by search id, newest first."""
+    grouped: Dict[int, List[Dict[str, Any]]] = {search_id: [] for search_id in search_ids}
+    if not grouped:
+        return grouped
+    placeholders = ", ".join("?" * len(grouped))
+    query = f"""
+        SELECT id, search_id, extractor, keyword, content_json AS "content_json [JSON]", created_at
+        FROM extractions
+        WHERE search_id IN ({placeholders})
+        ORDER BY created_at DESC
+    """
+    with db_cursor() as cur:
+        cur.execute(query, tuple(grouped))
+        for row in cur:
+            grouped[row["search_id"]].append(_extraction_from_row(row))
+    return grouped
 
 
 # Initialize schema on import
@@ -269,12 +554,21 @@ initialize_schema()
 __all__ = [
     "DB_PATH",
     "get_connection",
+    "close_connections",
     "initialize_schema",
     "insert_search",
     "bulk_insert_results",
+    "persist_search_with_results",
     "get_search",
+    "find_recent_search",
     "list_searches",
+    "iter_results",
     "list_results",
+    "results_by_search",
+    "count_results",
+    "data_version",
+    "extractions_version",
     "insert_extraction",
     "list_extractions",
+    "extractions_by_search",
 ]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 import textwrap
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from .db import get_search, insert_extraction, list_results, list_searches
 from .settings import DATASET
@@ -40,7 +40,7 @@ def _select_search(keyword: str, source: Optional[str], search_id: Optional[int]
     return search["id"], search
 
 
-def _prepare_context(results: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+def _prepare_context(results: Sequence[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
     context = []
     for idx, item in enumerate(results[:limit], start=1):
         context.append(
@@ -56,54 +56,56 @@ def _prepare_context(results: List[Dict[str, Any]], limit: int) -> List[Dict[str
     return context
 
 
+_FIELD_INSTRUCTIONS = textwrap.dedent(
+    """
+    Required JSON fields:
+    - name: concise label for the histopathology concept.
+    - definition: single sentence, morphology-forward, emphasising diagnostic cues.
+    - synonyms: list of lowercase or natural-case synonyms, deduplicated.
+    - concept_type: one of ["class","compartment","morphology","interface","substructure"].
+    - positives: 3–6 short phrases listing hallmark microscopic findings (patch scale).
+    - negatives: 3–6 confounders or exclusions to avoid false positives.
+    - magnifications: list subset of ["10x","20x","40x"] highlighting optimal recognition power.
+    """
+).strip()
+
+# Dedented once at import; formatting the evidence in afterwards keeps its lines flush-left.
+_PROMPT_TEMPLATE = textwrap.dedent(
+    """
+    You are curating the {dataset} histopathology ontology.
+    Keyword: "{keyword}"
+    Source: {source}
+
+    Use the search evidence below to draft a JSON object with the required fields.
+    Focus on morphology cues and differential diagnosis guidance. When evidence is missing, leave the field as an empty list or descriptive placeholder.
+
+    Evidence:
+    {context}
+
+    {fields}
+
+    Respond with valid JSON only.
+    """
+).strip()
+
+
 def _summarise_context(context: List[Dict[str, Any]]) -> str:
     blocks = []
     for entry in context:
         title = entry["title"] or "Untitled"
         snippet = entry["snippet"].strip()
-        url = entry["url"]
-        blocks.append(
-            textwrap.dedent(
-                f"""\
-                [{entry['index']}] {title}
-                URL: {url}
-                Summary: {snippet or 'N/A'}"""
-            ).strip()
-        )
+        blocks.append(f"[{entry['index']}] {title}\nURL: {entry['url']}\nSummary: {snippet or 'N/A'}")
     return "\n\n".join(blocks)
 
 
-def _build_prompt(keyword: str, source: str, context: List[Dict[str, Any]]) -> str:
-    context_block = _summarise_context(context)
-    field_instructions = textwrap.dedent(
-        """
-        Required JSON fields:
-        - name: concise label for the histopathology concept.
-        - definition: single sentence, morphology-forward, emphasising diagnostic cues.
-        - synonyms: list of lowercase or natural-case synonyms, deduplicated.
-        - concept_type: one of ["class","compartment","morphology","interface","substructure"].
-        - positives: 3–6 short phrases listing hallmark microscopic findings (patch scale).
-        - negatives: 3–6 confounders or exclusions to avoid false positives.
-        - magnifications: list subset of ["10x","20x","40x"] highlighting optimal recognition power.
-        """
-    ).strip()
-    return textwrap.dedent(
-        f"""
-        You are curating the {DATASET} histopathology ontology.
-        Keyword: "{keyword}"
-        Source: {source}
-
-        Use the search evidence below to draft a JSON object with the required fields.
-        Focus on morphology cues and differential diagnosis guidance. When evidence is missing, leave the field as an empty list or descriptive placeholder.
-
-        Evidence:
-        {context_block}
-
-        {field_instructions}
-
-        Respond with valid JSON only.
-        """
-    ).strip()
+def _build_prompt(keyword: str, source: str, context_block: str) -> str:
+    return _PROMPT_TEMPLATE.format(
+        dataset=DATASET,
+        keyword=keyword,
+        source=source,
+        context=context_block,
+        fields=_FIELD_INSTRUCTIONS,
+    )
 
 
 def run_extraction(
@@ -115,12 +117,12 @@ def run_extraction(
     extraction_payload: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     resolved_search_id, search_meta = _select_search(keyword, source, search_id)
-    results = list(list_results(resolved_search_id))
+    results = list_results(resolved_search_id, limit=max(max_context, 1))
     if not results:
         raise ValueError(f"No cached results for search id {resolved_search_id}. Run the search tool first.")
     context = _prepare_context(results, max_context)
-    prompt = _build_prompt(keyword, search_meta["source"], context)
     summary = _summarise_context(context)
+    prompt = _build_prompt(keyword, search_meta["source"], summary)
     extraction_content: Dict[str, Any] = {
         "keyword": keyword,
         "source": search_meta["source"],
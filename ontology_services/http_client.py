@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import atexit
+import importlib.util
 import json
+import random
 import re
 import time
+from functools import lru_cache
 from html import unescape
 from typing import Any, Dict, Optional, Tuple
 
@@ -13,17 +17,57 @@ import httpx
 DEFAULT_TIMEOUT: Tuple[float, float] = (6.0, 30.0)
 USER_AGENT = "OntologyMCP/1.0 (+https://example.com) httpx"
 HTML_TAG_RE = re.compile(r"<[^>]+>")
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+BACKOFF_BASE_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 8.0
 
 
-def _build_timeout(timeout: Tuple[float, float] | float | httpx.Timeout) -> httpx.Timeout:
-    if isinstance(timeout, httpx.Timeout):
-        return timeout
+@lru_cache(maxsize=8)
+def _timeout_from_value(timeout: Tuple[float, float] | float) -> httpx.Timeout:
     if isinstance(timeout, tuple):
         connect, read = timeout
         return httpx.Timeout(read, connect=connect)
     return httpx.Timeout(float(timeout))
 
 
+def _build_timeout(timeout: Tuple[float, float] | float | httpx.Timeout) -> httpx.Timeout:
+    # httpx.Timeout is unhashable, so only tuple/float inputs go through the memoized builder.
+    if isinstance(timeout, httpx.Timeout):
+        return timeout
+    return _timeout_from_value(timeout)
+
+
+# Keep-alive pool shared by all providers; HTTP/2 is used when the optional h2 package is present.
+# The transport retries failed connection attempts itself, so http_get only handles HTTP-level retries.
+_CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        retries=2,
+    ),
+    headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
+    timeout=_build_timeout(DEFAULT_TIMEOUT),
+)
+atexit.register(_CLIENT.close)
+
+
+def _backoff_delay(attempt: int) -> float:
+    return min(BACKOFF_BASE_SECONDS * 2**attempt, MAX_BACKOFF_SECONDS) * random.uniform(0.5, 1.0)
+
+
+def _retry_delay(attempt: int, response: httpx.Response) -> Optional[float]:
+    """Honour a numeric Retry-After header, otherwise back off exponentially with jitter.
+
+    Returns None when the server asks for a longer wait than ``MAX_BACKOFF_SECONDS``, so the caller fails
+    instead of retrying before the requested time.
+    """
+    retry_after = response.headers.get("retry-after", "")
+    if retry_after.isdigit():
+        delay = float(retry_after)
+        return delay if delay <= MAX_BACKOFF_SECONDS else None
+    return _backoff_delay(attempt)
+
+
 def strip_html(value: str) -> str:
     """Remove simple HTML tags and entities from provider snippets."""
     return HTML_TAG_RE.sub(" ", unescape(value or ""))
@@ -36,17 +80,16 @@ def http_get(
     timeout: Tuple[float, float] | float | httpx.Timeout = DEFAULT_TIMEOUT,
     retries: int = 2,
 ) -> Any:
-    request_headers = {"User-Agent": USER_AGENT, "Accept": "application/json"}
-    if headers:
-        request_headers.update(headers)
     timeout_config = _build_timeout(timeout)
     last_exc: Optional[Exception] = None
     for attempt in range(retries + 1):
         try:
-            response = httpx.get(url, params=params, headers=request_headers, timeout=timeout_config)
-            if response.status_code == 429 and attempt < retries:
-                time.sleep(1.5 * (attempt + 1))
-                continue
+            response = _CLIENT.get(url, params=params, headers=headers, timeout=timeout_config)
+            if response.status_code in RETRY_STATUS_CODES and attempt < retries:
+                delay = _retry_delay(attempt, response)
+                if delay is not None:
+                    time.sleep(delay)
+                    continue
             response.raise_for_status()
             content_type = response.headers.get("content-type", "")
             if "json" in content_type:
@@ -55,10 +98,13 @@ def http_get(
                 return response.json()
             except (ValueError, json.JSONDecodeError):
                 return response.text
+        except (httpx.HTTPStatusError, httpx.ConnectError, httpx.ConnectTimeout):
+            # Non-retryable statuses fail immediately; connect failures were already retried by the transport.
+            raise
         except Exception as exc:
             last_exc = exc
             if attempt < retries:
-                time.sleep(1.0 * (attempt + 1))
+                time.sleep(_backoff_delay(attempt))
                 continue
             break
     if last_exc is not None:
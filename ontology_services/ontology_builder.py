@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import datetime as dt
-import json
-from copy import deepcopy
+import os
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from .db import list_extractions
+import orjson
+
+from .db import extractions_version, list_extractions
 from .settings import STORE_ROOT
 
 BASE_ONTOLOGY_TREE: List[Dict[str, Any]] = [
@@ -42,6 +43,11 @@ BASE_ONTOLOGY_TREE: List[Dict[str, Any]] = [
 ]
 
 VERSIONS_DIR = STORE_ROOT / "ontology_versions"
+VERSION_TIMESTAMP_FORMAT = "%Y%m%dT%H%M%SZ"
+
+# (extractions_version, extracted concepts) from the last database scan; the version also moves when
+# another server process writes to the shared database.
+_extracted_cache: Optional[Tuple[Tuple[int, int], Tuple[Dict[str, Any], ...]]] = None
 
 
 def _normalize_concepts(extraction_payload: Any) -> Iterable[Dict[str, Any]]:
@@ -52,16 +58,30 @@ def _normalize_concepts(extraction_payload: Any) -> Iterable[Dict[str, Any]]:
     return []
 
 
+def _extracted_concepts() -> Tuple[Dict[str, Any], ...]:
+    global _extracted_cache
+    version = extractions_version()
+    if _extracted_cache is not None and _extracted_cache[0] == version:
+        return _extracted_cache[1]
+    concepts: List[Dict[str, Any]] = []
+    for record in list_extractions():
+        extraction = (record.get("content") or {}).get("extraction")
+        concepts.extend(_normalize_concepts(extraction))
+    _extracted_cache = (version, tuple(concepts))
+    return _extracted_cache[1]
+
+
 def build_ontology_tree(include_base: bool = True) -> List[Dict[str, Any]]:
-    """Combine the base ontology tree with extracted concepts from the database."""
+    """Combine the base ontology tree with extracted concepts from the database.
+
+    Extractions are rescanned only after the database changes, including writes from other server processes. Each
+    concept is a shallow copy, so its keys can be reassigned freely; nested lists are still shared with the cache and
+    ``BASE_ONTOLOGY_TREE``.
+    """
     tree: List[Dict[str, Any]] = []
     if include_base:
-        tree.extend(deepcopy(BASE_ONTOLOGY_TREE))
-
-    for record in list_extractions():
-        extraction = (record.get("content") or {}).get("extraction")
-        for concept in _normalize_concepts(extraction):
-            tree.append(concept)
+        tree.extend(dict(concept) for concept in BASE_ONTOLOGY_TREE)
+    tree.extend(dict(concept) for concept in _extracted_concepts())
     return tree
 
 
@@ -75,13 +95,19 @@ def save_ontology_tree(
     if version_name:
         filename = version_name
     else:
-        timestamp = dt.datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+        timestamp = dt.datetime.now(dt.UTC).strftime(VERSION_TIMESTAMP_FORMAT)
         filename = f"ontology_{timestamp}.json"
     if ensure_suffix and not filename.endswith(".json"):
         filename = f"{filename}.json"
     target = VERSIONS_DIR / filename
-    with target.open("w", encoding="utf-8") as handle:
-        json.dump(tree, handle, indent=2, ensure_ascii=False)
+    # Write beside the target and rename so an interrupted save never leaves a truncated snapshot.
+    staging = target.with_name(f"{target.name}.tmp")
+    try:
+        staging.write_bytes(orjson.dumps(tree, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        os.replace(staging, target)
+    except BaseException:
+        staging.unlink(missing_ok=True)
+        raise
     return target
 
 
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import textwrap
-from typing import Any, Callable, Dict, List
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, List, Tuple
 
 ProviderFunc = Callable[[str, int], List[Dict[str, Any]]]
 
@@ -18,4 +19,18 @@ def mock_result(title: str, url: str, published: str, license_: str, snippet: st
     }
 
 
-__all__ = ["ProviderFunc", "mock_result"]
+def cached_provider(func: ProviderFunc) -> ProviderFunc:
+    """Memoize a deterministic provider; each call still gets its own shallow copies of the items."""
+
+    @lru_cache(maxsize=512)
+    def _build(query: str, max_results: int) -> Tuple[Dict[str, Any], ...]:
+        return tuple(func(query, max_results))
+
+    @wraps(func)
+    def wrapper(query: str, max_results: int) -> List[Dict[str, Any]]:
+        return [dict(item) for item in _build(query, max_results)]
+
+    return wrapper
+
+
+__all__ = ["ProviderFunc", "cached_provider", "mock_result"]
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import os
-import textwrap
-from typing import Dict, List, Literal
+import re
+from itertools import islice
+from typing import Any, Dict, List, Literal
 
 from ..http_client import http_get, strip_html
 from .base import ProviderFunc, mock_result
@@ -19,15 +20,31 @@ LiteratureSource = Literal[
     "web_of_science",
 ]
 
+SNIPPET_WIDTH = 800
+SNIPPET_PLACEHOLDER = "..."
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _shorten(text: str, width: int = SNIPPET_WIDTH) -> str:
+    """Collapse whitespace and truncate at a word boundary, like ``textwrap.shorten`` without re-wrapping."""
+    text = WHITESPACE_RE.sub(" ", text).strip()
+    if len(text) <= width:
+        return text
+    head, sep, _ = text[: width - len(SNIPPET_PLACEHOLDER) + 1].rpartition(" ")
+    if not sep:
+        head = text[: width - len(SNIPPET_PLACEHOLDER)]
+    return head.rstrip() + SNIPPET_PLACEHOLDER
+
 
 def search_europe_pmc(query: str, max_results: int) -> List[Dict[str, str]]:
+    max_results = max(max_results, 0)
     data = http_get(
         "https://www.ebi.ac.uk/europepmc/webservices/rest/search",
         params={"query": query, "format": "json", "pageSize": max_results},
     )
     items = (data.get("resultList") or {}).get("result", []) if isinstance(data, dict) else []
     results: List[Dict[str, str]] = []
-    for entry in items[:max_results]:
+    for entry in islice(items, max_results):
         title = entry.get("title") or ""
         pmcid = entry.get("pmcid")
         pmid = entry.get("pmid")
@@ -44,21 +61,29 @@ def search_europe_pmc(query: str, max_results: int) -> List[Dict[str, str]]:
                 "url": url_item,
                 "published": str(entry.get("firstPublicationDate") or entry.get("pubYear") or ""),
                 "license": entry.get("license") or "",
-                "snippet": textwrap.shorten(snippet, width=800, placeholder="..."),
+                "snippet": _shorten(snippet),
                 "source": "europe_pmc",
             }
         )
     return results
 
 
+def _ncbi_params(**params: Any) -> Dict[str, Any]:
+    api_key = os.environ.get("NCBI_API_KEY")
+    if api_key:
+        params["api_key"] = api_key
+    return params
+
+
 def search_pubmed(query: str, max_results: int) -> List[Dict[str, str]]:
+    max_results = max(max_results, 0)
     base = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
     search_data = http_get(
         f"{base}/esearch.fcgi",
-        params={"db": "pubmed", "term": query, "retmax": max_results, "retmode": "json"},
+        params=_ncbi_params(db="pubmed", term=query, retmax=max_results, retmode="json"),
     )
     idlist = (
-        (search_data.get("esearchresult") or {}).get("idlist", [])[:max_results]
+        (search_data.get("esearchresult") or {}).get("idlist", [])
         if isinstance(search_data, dict)
         else []
     )
@@ -67,7 +92,7 @@ def search_pubmed(query: str, max_results: int) -> List[Dict[str, str]]:
 
     summary_data = http_get(
         f"{base}/esummary.fcgi",
-        params={"db": "pubmed", "id": ",".join(idlist), "retmode": "json"},
+        params=_ncbi_params(db="pubmed", id=",".join(islice(idlist, max_results)), retmode="json"),
     )
     result_payload = summary_data.get("result") if isinstance(summary_data, dict) else {}
     uids = result_payload.get("uids", []) if isinstance(result_payload, dict) else []
@@ -85,7 +110,7 @@ def search_pubmed(query: str, max_results: int) -> List[Dict[str, str]]:
                 "url": f"https://pubmed.ncbi.nlm.nih.gov/{uid}/",
                 "published": record.get("pubdate") or record.get("epubdate") or "",
                 "license": "",
-                "snippet": textwrap.shorten(snippet or title, width=800, placeholder="..."),
+                "snippet": _shorten(snippet or title),
                 "source": "pubmed",
             }
         )
@@ -93,6 +118,7 @@ def search_pubmed(query: str, max_results: int) -> List[Dict[str, str]]:
 
 
 def search_semantic_scholar(query: str, max_results: int) -> List[Dict[str, str]]:
+    max_results = max(max_results, 0)
     params = {
         "query": query,
         "limit": max_results,
@@ -109,7 +135,7 @@ def search_semantic_scholar(query: str, max_results: int) -> List[Dict[str, str]
     )
     items = data.get("data", []) if isinstance(data, dict) else []
     results: List[Dict[str, str]] = []
-    for entry in items[:max_results]:
+    for entry in islice(items, max_results):
         title = entry.get("title") or ""
         open_access = entry.get("openAccessPdf") or {}
         url_item = open_access.get("url") or entry.get("url") or ""
@@ -120,7 +146,7 @@ def search_semantic_scholar(query: str, max_results: int) -> List[Dict[str, str]
                 "url": url_item,
                 "published": str(entry.get("year") or ""),
                 "license": "",
-                "snippet": textwrap.shorten(abstract_text, width=800, placeholder="..."),
+                "snippet": _shorten(abstract_text),
                 "source": "semantic_scholar",
             }
         )
@@ -128,6 +154,7 @@ def search_semantic_scholar(query: str, max_results: int) -> List[Dict[str, str]
 
 
 def search_crossref(query: str, max_results: int) -> List[Dict[str, str]]:
+    max_results = max(max_results, 0)
     data = http_get(
         "https://api.crossref.org/works",
         params={"query": query, "rows": max_results},
@@ -135,7 +162,7 @@ def search_crossref(query: str, max_results: int) -> List[Dict[str, str]]:
     message = data.get("message", {}) if isinstance(data, dict) else {}
     items = message.get("items", []) if isinstance(message, dict) else []
     results: List[Dict[str, str]] = []
-    for entry in items[:max_results]:
+    for entry in islice(items, max_results):
         title_list = entry.get("title") or []
         title = title_list[0] if title_list else ""
         date_parts = (entry.get("issued") or {}).get("date-parts", [])
@@ -152,7 +179,7 @@ def search_crossref(query: str, max_results: int) -> List[Dict[str, str]]:
                 "url": entry.get("URL") or "",
                 "published": published,
                 "license": license_url,
-                "snippet": textwrap.shorten(snippet_source, width=800, placeholder="..."),
+                "snippet": _shorten(snippet_source),
                 "source": "crossref",
             }
         )
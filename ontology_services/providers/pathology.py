@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Dict, List, Literal
 
-from .base import ProviderFunc, mock_result
+from .base import ProviderFunc, cached_provider, mock_result
 
 PathologySource = Literal[
     "pathology_outlines",
@@ -14,6 +14,7 @@ PathologySource = Literal[
 ]
 
 
+@cached_provider
 def search_pathology_outlines(query: str, max_results: int) -> List[Dict[str, str]]:
     return [
         mock_result(
@@ -26,6 +27,7 @@ def search_pathology_outlines(query: str, max_results: int) -> List[Dict[str, st
     ][:max_results]
 
 
+@cached_provider
 def search_stanford_criteria(query: str, max_results: int) -> List[Dict[str, str]]:
     return [
         mock_result(
@@ -38,6 +40,7 @@ def search_stanford_criteria(query: str, max_results: int) -> List[Dict[str, str
     ][:max_results]
 
 
+@cached_provider
 def search_libre_pathology(query: str, max_results: int) -> List[Dict[str, str]]:
     return [
         mock_result(
@@ -50,6 +53,7 @@ def search_libre_pathology(query: str, max_results: int) -> List[Dict[str, str]]
     ][:max_results]
 
 
+@cached_provider
 def search_cap_protocols(query: str, max_results: int) -> List[Dict[str, str]]:
     return [
         mock_result(
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Dict, List, Literal
 
-from .base import ProviderFunc, mock_result
+from .base import ProviderFunc, cached_provider, mock_result
 
 OntologySource = Literal[
     "ncbo_bioportal",
@@ -16,6 +16,7 @@ OntologySource = Literal[
 ]
 
 
+@cached_provider
 def search_ncbo_bioportal(query: str, max_results: int) -> List[Dict[str, str]]:
     return [
         mock_result(
@@ -28,6 +29,7 @@ def search_ncbo_bioportal(query: str, max_results: int) -> List[Dict[str, str]]:
     ][:max_results]
 
 
+@cached_provider
 def search_ebi_ols(query: str, max_results: int) -> List[Dict[str, str]]:
     return [
         mock_result(
@@ -40,6 +42,7 @@ def search_ebi_ols(query: str, max_results: int) -> List[Dict[str, str]]:
     ][:max_results]
 
 
+@cached_provider
 def search_nci_thesaurus(query: str, max_results: int) -> List[Dict[str, str]]:
     return [
         mock_result(
@@ -52,6 +55,7 @@ def search_nci_thesaurus(query: str, max_results: int) -> List[Dict[str, str]]:
     ][:max_results]
 
 
+@cached_provider
 def search_snomed_ct(query: str, max_results: int) -> List[Dict[str, str]]:
     return [
         mock_result(
@@ -64,6 +68,7 @@ def search_snomed_ct(query: str, max_results: int) -> List[Dict[str, str]]:
     ][:max_results]
 
 
+@cached_provider
 def search_mesh(query: str, max_results: int) -> List[Dict[str, str]]:
     return [
         mock_result(
@@ -76,6 +81,7 @@ def search_mesh(query: str, max_results: int) -> List[Dict[str, str]]:
     ][:max_results]
 
 
+@cached_provider
 def search_icdo3(query: str, max_results: int) -> List[Dict[str, str]]:
     return [
         mock_result(
@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List
+
+import orjson
 
 from .providers.base import ProviderFunc
-from .storage import write_results
+from .settings import SEARCH_CACHE_TTL
+from .storage import read_cached_results, write_results
+
+MAX_PARALLEL_PROVIDERS = 8
+
+
+def _dumps(payload: Any) -> str:
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
 
 
 def run_provider(providers: Dict[str, ProviderFunc], source: str, query: str, max_results: int) -> List[Dict[str, Any]]:
-    if source not in providers:
+    try:
+        provider = providers[source]
+    except KeyError:
         available = ", ".join(sorted(providers))
-        raise ValueError(f"Unsupported source '{source}'. Available sources: {available}")
-    return providers[source](query, max_results)
+        raise ValueError(f"Unsupported source '{source}'. Available sources: {available}") from None
+    return provider(query, max_results)
 
 
 def execute_search(
@@ -25,25 +36,97 @@ def execute_search(
 ) -> str:
     keyword = keyword.strip()
     if not keyword:
-        return json.dumps({"status": "error", "error": "Keyword must not be empty."}, indent=2)
-    try:
-        results = run_provider(providers, source, keyword, max_results)
-    except Exception as exc:
-        return json.dumps({"status": "error", "error": str(exc)}, indent=2)
+        return _dumps({"status": "error", "error": "Keyword must not be empty."})
+
+    cached = read_cached_results(keyword, source, max_results, SEARCH_CACHE_TTL)
+    if cached is not None:
+        search_id, results = cached
+        summary = _summary(keyword, source, tool_name, search_id, results, 0, len(results), cached=True)
+    else:
+        try:
+            results = run_provider(providers, source, keyword, max_results)
+        except Exception as exc:
+            return _dumps({"status": "error", "error": str(exc)})
+        search_id, added, total_cached = write_results(keyword, source, tool_name, max_results, results)
+        summary = _summary(keyword, source, tool_name, search_id, results, added, total_cached, cached=False)
+    return _dumps(summary)
+
+
+def execute_search_multi(
+    keyword: str,
+    sources: Iterable[str],
+    tool_name: str,
+    max_results: int,
+    providers: Dict[str, ProviderFunc],
+) -> str:
+    """Query several sources concurrently and report one summary per source.
 
-    search_id, added, total_cached = write_results(keyword, source, tool_name, max_results, results)
-    summary = {
+    Provider calls are blocking HTTP, so they run in a thread pool; results are persisted from the
+    calling thread to keep a single SQLite writer.
+    """
+    keyword = keyword.strip()
+    if not keyword:
+        return _dumps({"status": "error", "error": "Keyword must not be empty."})
+
+    ordered = list(dict.fromkeys(sources))
+    summaries: Dict[str, Dict[str, Any]] = {}
+    pending: List[str] = []
+    for source in ordered:
+        cached = read_cached_results(keyword, source, max_results, SEARCH_CACHE_TTL)
+        if cached is None:
+            pending.append(source)
+            continue
+        search_id, results = cached
+        summaries[source] = _summary(keyword, source, tool_name, search_id, results, 0, len(results), cached=True)
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_PROVIDERS, len(pending))) as executor:
+            futures = {
+                executor.submit(run_provider, providers, source, keyword, max_results): source for source in pending
+            }
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    results = future.result()
+                except Exception as exc:
+                    summaries[source] = {"status": "error", "source": source, "error": str(exc)}
+                    continue
+                search_id, added, total_cached = write_results(keyword, source, tool_name, max_results, results)
+                summaries[source] = _summary(
+                    keyword, source, tool_name, search_id, results, added, total_cached, cached=False
+                )
+
+    payload = {
+        "status": "ok",
+        "keyword": keyword,
+        "tool_name": tool_name,
+        "searches": [summaries[source] for source in ordered],
+    }
+    return _dumps(payload)
+
+
+def _summary(
+    keyword: str,
+    source: str,
+    tool_name: str,
+    search_id: int,
+    results: List[Dict[str, Any]],
+    added: int,
+    total_cached: int,
+    cached: bool,
+) -> Dict[str, Any]:
+    return {
         "status": "ok",
         "keyword": keyword,
         "source": source,
         "tool_name": tool_name,
         "search_id": search_id,
+        "cached": cached,
         "results_returned": len(results),
         "results_stored": added,
         "total_cached": total_cached,
-        "preview": results[: min(3, len(results))],
+        "preview": results[:3],
     }
-    return json.dumps(summary, indent=2, ensure_ascii=False)
 
 
-__all__ = ["run_provider", "execute_search"]
+__all__ = ["run_provider", "execute_search", "execute_search_multi"]
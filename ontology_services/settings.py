@@ -7,5 +7,6 @@ from pathlib import Path
 
 DATASET = os.environ.get("DATASET_NAME", "Camelyon16")
 STORE_ROOT = Path(os.environ.get("ONTOLOGY_DOC_DIR", "documents"))
+SEARCH_CACHE_TTL = int(os.environ.get("ONTOLOGY_SEARCH_TTL", "86400"))
 
-__all__ = ["DATASET", "STORE_ROOT"]
+__all__ = ["DATASET", "STORE_ROOT", "SEARCH_CACHE_TTL"]
@@ -5,12 +5,15 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Tuple
 
 from .db import (
-    bulk_insert_results,
+    count_results,
+    extractions_by_search,
+    find_recent_search,
     get_search,
-    insert_search,
     list_extractions,
     list_results,
     list_searches,
+    persist_search_with_results,
+    results_by_search,
 )
 
 
@@ -22,15 +25,35 @@ def write_results(
     results: List[Dict[str, Any]],
 ) -> Tuple[int, int, int]:
     args = {"keyword": keyword, "source": source, "tool": tool_name, "max_results": max_results}
-    search_id = insert_search(keyword, source, tool_name, max_results, args)
-    added = bulk_insert_results(search_id, results)
-    total_cached = len(list_results(search_id))
+    search_id, added = persist_search_with_results(keyword, source, tool_name, max_results, args, results)
+    total_cached = count_results(search_id)
     return search_id, added, total_cached
 
 
+def read_cached_results(
+    keyword: str,
+    source: str,
+    max_results: int,
+    max_age_seconds: int,
+) -> Optional[Tuple[int, List[Dict[str, Any]]]]:
+    """Return the newest cached search for the same arguments if it is younger than ``max_age_seconds``."""
+    if max_age_seconds <= 0:
+        return None
+    search_id = find_recent_search(keyword, source, max_results, max_age_seconds)
+    if search_id is None:
+        return None
+    results = list(list_results(search_id))
+    if not results:
+        return None
+    return search_id, results
+
+
 def read_results(keyword: str, source: Optional[str] = None) -> Dict[str, Any]:
     payload: Dict[str, Any] = {"keyword": keyword, "sources": {}}
     searches = list_searches(keyword, source)
+    search_ids = [search["id"] for search in searches]
+    results = results_by_search(search_ids)
+    extractions = extractions_by_search(search_ids)
     for search in searches:
         src = search["source"]
         entry = payload["sources"].setdefault(src, {"searches": []})
@@ -42,8 +65,8 @@ def read_results(keyword: str, source: Optional[str] = None) -> Dict[str, Any]:
                 "requested_at": search["requested_at"],
                 "max_results": search["max_results"],
                 "args": search["args"],
-                "results": list(list_results(search_id)),
-                "extractions": list(list_extractions(search_id=search_id)),
+                "results": results[search_id],
+                "extractions": extractions[search_id],
             }
         )
     return payload
@@ -73,4 +96,4 @@ def read_search(
     return bundle
 
 
-__all__ = ["write_results", "read_results", "read_search"]
+__all__ = ["write_results", "read_cached_results", "read_results", "read_search"]
@@ -4,13 +4,14 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import sqlite3
 import sys
 from pathlib import Path
 from typing import Any, Iterable, Optional
 
+import orjson
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
@@ -29,26 +30,25 @@ def resolve_order_column(columns: Iterable[str]) -> Optional[str]:
 def maybe_parse_json(value: Any) -> Any:
     if isinstance(value, str) and value and value.strip().startswith(("{", "[")):
         try:
-            return json.loads(value)
-        except json.JSONDecodeError:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
             return value
     return value
 
 
+def quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
 def query_table(conn: sqlite3.Connection, table: str, limit: int = 5) -> list[dict[str, Any]]:
-    info_cursor = conn.execute(f"PRAGMA table_info({table})")
-    columns = [row[1] for row in info_cursor.fetchall()]
+    info_cursor = conn.execute("SELECT name FROM pragma_table_info(?) ORDER BY cid", (table,))
+    columns = [row[0] for row in info_cursor.fetchall()]
+    if not columns:
+        raise sqlite3.OperationalError(f"no such table: {table}")
     order_column = resolve_order_column(columns)
-    order_clause = f"ORDER BY {order_column} DESC" if order_column else ""
-    cursor = conn.execute(f"SELECT * FROM {table} {order_clause} LIMIT ?", (limit,))
-    rows = cursor.fetchall()
-    records = []
-    for row in rows:
-        record = {}
-        for idx in range(len(columns)):
-            record[columns[idx]] = maybe_parse_json(row[idx])
-        records.append(record)
-    return records
+    order_clause = f"ORDER BY {quote_identifier(order_column)} DESC" if order_column else ""
+    cursor = conn.execute(f"SELECT * FROM {quote_identifier(table)} {order_clause} LIMIT ?", (limit,))
+    return [dict(zip(columns, map(maybe_parse_json, row))) for row in cursor]
 
 
 def main() -> None:
@@ -102,8 +102,8 @@ def main() -> None:
                 print("  (no rows)\n")
                 continue
             for row in rows:
-                pretty = json.dumps(row, ensure_ascii=False, indent=2)
-                print(pretty)
+                pretty = orjson.dumps(row, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                print(pretty.decode("utf-8"))
                 print()
     finally:
         conn.close()
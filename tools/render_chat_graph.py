@@ -9,18 +9,35 @@ import textwrap
 from pathlib import Path
 from typing import Any, Dict, List
 
+import orjson
+
+LABEL_ESCAPES = str.maketrans({"\n": "\\n", '"': '\\"'})
+EVENT_CLASSES = {
+    "user": "user",
+    "assistant_text": "assistant",
+    "tool_use": "tool",
+    "tool_result": "result",
+    "tool_error": "result",
+}
+
 
 def load_trace(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    data = path.read_bytes()
+    if path.suffix != ".jsonl":
+        return orjson.loads(data)
+    lines = [line for line in data.splitlines() if line.strip()]
+    if not lines:
+        return {"events": []}
+    trace = orjson.loads(lines[0])
+    trace["events"] = [orjson.loads(line) for line in lines[1:]]
+    return trace
 
 
 def sanitize_label(text: str, width: int = 40) -> str:
     text = str(text).replace("\r", " ").strip()
     if not text:
         text = "(empty)"
-    wrapped = textwrap.fill(text, width=width)
-    return wrapped.replace("\n", "\\n").replace('"', '\\"')
+    return textwrap.fill(text, width=width).translate(LABEL_ESCAPES)
 
 
 def event_label(event: Dict[str, Any]) -> str:
@@ -52,35 +69,26 @@ def event_label(event: Dict[str, Any]) -> str:
 
 def build_mermaid(trace: Dict[str, Any]) -> str:
     events = trace.get("events", [])
-    nodes = []
+    nodes = [f'  n{idx}["{event_label(event)}"]' for idx, event in enumerate(events)]
+    classes = [
+        f"  class n{idx} {EVENT_CLASSES.get(event.get('type', 'event'), 'other')};"
+        for idx, event in enumerate(events)
+    ]
     edges = []
-    classes = []
     tool_map: Dict[str, str] = {}
+    last = len(events) - 1
 
     for idx, event in enumerate(events):
         node_id = f"n{idx}"
-        label = event_label(event)
         etype = event.get("type", "event")
-
-        nodes.append(f'  {node_id}["{label}"]')
-
-        if idx < len(events) - 1:
+        if idx < last:
             edges.append(f"  {node_id} --> n{idx + 1}")
-
-        if etype == "user":
-            classes.append(f"  class {node_id} user;")
-        elif etype == "assistant_text":
-            classes.append(f"  class {node_id} assistant;")
-        elif etype == "tool_use":
-            classes.append(f"  class {node_id} tool;")
+        if etype == "tool_use":
             tool_map[event.get("tool_use_id", "")] = node_id
         elif etype in ("tool_result", "tool_error"):
-            classes.append(f"  class {node_id} result;")
             tool_id = event.get("tool_use_id")
             if tool_id and tool_id in tool_map:
                 edges.append(f"  {tool_map[tool_id]} -.-> {node_id}")
-        else:
-            classes.append(f"  class {node_id} other;")
 
     header = [
         "graph TD",
@@ -99,7 +107,7 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Render chatbot trace as a Mermaid diagram.")
     parser.add_argument(
         "trace_path",
-        help="Path to a trace JSON file created by chatbot.py (documents/chat_logs/...json).",
+        help="Path to a trace file created by chatbot.py (documents/chat_logs/...jsonl, or legacy .json).",
     )
     parser.add_argument(
         "--output",